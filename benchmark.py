@@ -0,0 +1,245 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import profiling
+import task1_data_structures as ds
+import task3_dijkstra as dj
+import task5_visualize_tree_traversal as traversal
+import task6_greedy_dp as knapsack
+import task7_monte_carlo as dice
+
+# Benchmark runner for the hot paths of all tasks.
+#
+#   python benchmark.py --output before.json
+#   python benchmark.py --output after.json --compare before.json
+#
+# Every case is timed "repeat" times with profiling hooks disabled; one extra run
+# with hooks enabled records counters and per-function call counts.
+
+
+def linked_list_of(values: list[int]) -> ds.LinkedList:
+    # O(n) build (insert_at_end would be O(n^2))
+    llist = ds.LinkedList()
+    for v in reversed(values):
+        llist.insert_at_beginning(v)
+    return llist
+
+
+def random_values(n: int, seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randint(0, 10 * n) for _ in range(n)]
+
+
+def random_graph(n: int, edges_per_node: int = 5, seed: int = 0) -> dj.WeightedGraph:
+    rng = random.Random(seed)
+    g = dj.WeightedGraph()
+    for u in range(n):
+        g.add_node(u)
+        for _ in range(edges_per_node):
+            g.add_edge(u, rng.randrange(n), rng.randint(1, 100))
+    return g
+
+
+# Each setup(size) prepares inputs (not timed) and returns the function to time.
+
+def setup_insert_at_end(n: int):
+    values = random_values(n)
+
+    def run():
+        llist = ds.LinkedList()
+        for v in values:
+            llist.insert_at_end(v)
+
+    return run
+
+
+# Call methods through the instance at run time (not a bound method captured here),
+# so the profiled run goes through the hook wrappers installed by profiling.enable()
+
+def setup_merge_sort(n: int):
+    llist = linked_list_of(random_values(n))
+    return lambda: llist.merge_sort()
+
+
+def setup_reverse(n: int):
+    llist = linked_list_of(random_values(n))
+    return lambda: llist.reverse()
+
+
+def setup_search(n: int):
+    llist = linked_list_of(random_values(n))
+    return lambda: llist.search_element(-1)  # missing value: full scan
+
+
+def setup_dijkstra(n: int):
+    g = random_graph(n)
+    return lambda: dj.dijkstra(g, 0)
+
+
+def setup_knapsack_mode(mode: str, n_items: int = 100):
+    # size = budget
+    def setup(budget: int):
+        menu = knapsack.random_menu(n_items, max_cost=max(1, budget // 4), seed=0)
+        return lambda: knapsack.dynamic_programming(menu, budget, mode=mode)
+
+    return setup
+
+
+def setup_branch_and_bound(n: int):
+    # size = number of items, budget = a quarter of the total cost
+    menu = knapsack.random_menu(n, max_cost=1000, seed=0)
+    budget = sum(data["cost"] for data in menu.values()) // 4
+    return lambda: knapsack.branch_and_bound(menu, budget)
+
+
+def setup_solve_many(budget: int):
+    # size = max budget, 1000 budgets per query, fresh cache every run
+    menu = knapsack.random_menu(100, max_cost=max(1, budget // 4), seed=0)
+    budgets = [random.Random(i).randint(0, budget) for i in range(1000)]
+
+    def run():
+        knapsack._choices_cache.clear()
+        knapsack.solve_many(menu, budgets)
+
+    return run
+
+
+def setup_two_dice(trials: int):
+    return lambda: dice.simulate_two_dice(trials, seed=0)
+
+
+def setup_dice_numpy(trials: int):
+    return lambda: dice.simulate_dice_numpy(trials, seed=0)
+
+
+def setup_tree_layout(n: int):
+    import networkx  # noqa: F401  (first lazy import happens here, outside the timing)
+
+    root = traversal.heap_array_to_tree(traversal.heapify_list(random_values(n)))
+    return lambda: traversal.build_nx_tree_and_pos(root)
+
+
+# (name, full sizes, quick sizes, setup)
+CASES = [
+    ("linked_list.insert_at_end", [200, 1_000, 3_000], [100, 500], setup_insert_at_end),
+    ("linked_list.merge_sort", [1_000, 10_000, 100_000], [1_000, 10_000], setup_merge_sort),
+    ("linked_list.reverse", [1_000, 10_000, 100_000], [1_000, 10_000], setup_reverse),
+    ("linked_list.search_element", [1_000, 10_000, 100_000], [1_000, 10_000], setup_search),
+    ("dijkstra", [1_000, 10_000, 50_000], [1_000, 5_000], setup_dijkstra),
+    ("knapsack.table", [1_000, 5_000, 20_000], [500, 2_000], setup_knapsack_mode("table")),
+    ("knapsack.numpy", [1_000, 5_000, 20_000], [500, 2_000], setup_knapsack_mode("numpy")),
+    ("knapsack.pareto", [1_000, 5_000, 20_000], [500, 2_000], setup_knapsack_mode("pareto")),
+    ("knapsack.branch_and_bound", [100, 1_000, 5_000], [100, 1_000], setup_branch_and_bound),
+    ("knapsack.solve_many", [1_000, 5_000, 20_000], [500, 2_000], setup_solve_many),
+    ("dice.simulate_two_dice", [10_000, 100_000, 300_000], [10_000, 50_000], setup_two_dice),
+    ("dice.numpy", [1_000_000, 10_000_000], [1_000_000], setup_dice_numpy),
+    ("tree_layout", [100, 1_000, 10_000], [100, 1_000], setup_tree_layout),
+]
+
+
+def run_case(setup, size: int, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        fn = setup(size)
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    # One more run with hooks on, only for counters
+    fn = setup(size)
+    with profiling.profiled() as stats:
+        fn()
+
+    return {
+        "size": size,
+        "repeat": repeat,
+        "min_seconds": min(times),
+        "mean_seconds": sum(times) / len(times),
+        "counters": stats["counters"],
+        "calls": stats["calls"],
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_benchmarks(repeat: int = 3, quick: bool = False, only: str | None = None) -> dict:
+    results = []
+    for name, sizes, quick_sizes, setup in CASES:
+        if only and only not in name:
+            continue
+        for size in quick_sizes if quick else sizes:
+            result = {"case": name, **run_case(setup, size, repeat)}
+            print(f"{name:<28} {size:>10}  {result['min_seconds']:.5f}s", flush=True)
+            results.append(result)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def print_comparison(old: dict, new: dict) -> None:
+    # Compare min times of matching (case, size) pairs; ratio > 1 means the new run is faster
+    old_times = {(r["case"], r["size"]): r["min_seconds"] for r in old["results"]}
+
+    print(f"\nBaseline: {old['meta'].get('commit')}  Current: {new['meta'].get('commit')}")
+    print(f"{'Case':<28} | {'Size':>10} | {'Old s':>9} | {'New s':>9} | {'Speedup':>8}")
+    print("-" * 76)
+    for r in new["results"]:
+        key = (r["case"], r["size"])
+        if key not in old_times:
+            continue
+        before, after = old_times[key], r["min_seconds"]
+        print(f"{r['case']:<28} | {r['size']:>10} | {before:>9.5f} | {after:>9.5f} | {before / after:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the task algorithms and write JSON results.")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write JSON results")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case and size")
+    parser.add_argument("--quick", action="store_true", help="Smaller input sizes")
+    parser.add_argument("--only", default=None, help="Run only cases whose name contains this text")
+    parser.add_argument("--compare", default=None, help="Earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    results = run_benchmarks(repeat=args.repeat, quick=args.quick, only=args.only)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
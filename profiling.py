@@ -0,0 +1,110 @@
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+# Optional timing/counter hooks for the hot paths of the task modules.
+# @hook("name") only registers a function; it is NOT wrapped until enable() is called,
+# so disabled hooks add no wrapper overhead. count() calls stay in the code and are
+# cheap no-ops when disabled (one function call and a flag check each).
+# Wrappers replace the module/class attribute, so call through the module
+# (task6_greedy_dp.dynamic_programming) rather than a name imported before enable().
+
+enabled = False
+counters = Counter()  # name -> accumulated count
+calls = Counter()     # hook name -> number of calls
+seconds = Counter()   # hook name -> total wall time
+
+_registry = []  # (hook name, original function)
+_patched = []   # (owner, attribute, original function)
+
+
+def hook(name: str):
+    # Register a function or method for timing when profiling is enabled
+    def register(func):
+        _registry.append((name, func))
+        return func
+
+    return register
+
+
+def count(name: str, n: int = 1) -> None:
+    # Add n to a named counter (no-op unless profiling is enabled)
+    if enabled:
+        counters[name] += n
+
+
+def _owner(func):
+    # Module or class that holds func, found from its qualified name
+    owner = sys.modules[func.__module__]
+    for part in func.__qualname__.split(".")[:-1]:
+        owner = getattr(owner, part)
+    return owner
+
+
+def _timed(name: str, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds[name] += time.perf_counter() - start
+            calls[name] += 1
+
+    return wrapper
+
+
+def enable() -> None:
+    # Swap every registered function for a timed wrapper
+    global enabled
+    if enabled:
+        return
+
+    for name, func in _registry:
+        owner = _owner(func)
+        attr = func.__name__
+        if getattr(owner, attr, None) is func:
+            setattr(owner, attr, _timed(name, func))
+            _patched.append((owner, attr, func))
+
+    enabled = True
+
+
+def disable() -> None:
+    # Restore the original functions
+    global enabled
+    while _patched:
+        owner, attr, func = _patched.pop()
+        setattr(owner, attr, func)
+
+    enabled = False
+
+
+def reset() -> None:
+    counters.clear()
+    calls.clear()
+    seconds.clear()
+
+
+def report() -> dict:
+    # Snapshot of everything collected so far
+    return {
+        "counters": dict(counters),
+        "calls": dict(calls),
+        "seconds": dict(seconds),
+    }
+
+
+@contextmanager
+def profiled():
+    # Collect hooks and counters inside a with-block: with profiled() as stats: ...
+    reset()
+    enable()
+    stats = {}
+    try:
+        yield stats
+    finally:
+        disable()
+        stats.update(report())
@@ -1,3 +1,6 @@
+import profiling
+
+
 class Node:
     def __init__(self, data=None):
         self.data = data
@@ -8,11 +11,13 @@ class LinkedList:
     def __init__(self):
         self.head = None
 
+    @profiling.hook("linked_list.insert_at_beginning")
     def insert_at_beginning(self, data):
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
 
+    @profiling.hook("linked_list.insert_at_end")
     def insert_at_end(self, data):
         new_node = Node(data)
         if self.head is None:
@@ -24,6 +29,7 @@ class LinkedList:
             cur = cur.next
         cur.next = new_node
 
+    @profiling.hook("linked_list.insert_after")
     def insert_after(self, prev_node: Node, data):
         if prev_node is None:
             print("Previous node does not exist.")
@@ -33,6 +39,7 @@ class LinkedList:
         new_node.next = prev_node.next
         prev_node.next = new_node
 
+    @profiling.hook("linked_list.delete_node")
     def delete_node(self, key: int):
         cur = self.head
 
@@ -50,6 +57,7 @@ class LinkedList:
 
         prev.next = cur.next
 
+    @profiling.hook("linked_list.search_element")
     def search_element(self, data: int) -> Node | None:
         cur = self.head
         while cur:
@@ -65,6 +73,7 @@ class LinkedList:
             current = current.next
 
     # Reverse linked list
+    @profiling.hook("linked_list.reverse")
     def reverse(self):
         prev = None
         cur = self.head
@@ -78,6 +87,7 @@ class LinkedList:
         self.head = prev # New head is the old tail
 
     # Sort linked list (merge sort)
+    @profiling.hook("linked_list.merge_sort")
     def merge_sort(self):
         self.head = self._merge_sort_head(self.head)
 
@@ -136,40 +146,41 @@ class LinkedList:
         return merged
 
 
-# Test case
-llist = LinkedList()
+if __name__ == "__main__":
+    # Test case
+    llist = LinkedList()
 
-# Insert nodes at the beginning
-llist.insert_at_beginning(5)
-llist.insert_at_beginning(10)
-llist.insert_at_beginning(15)
+    # Insert nodes at the beginning
+    llist.insert_at_beginning(5)
+    llist.insert_at_beginning(10)
+    llist.insert_at_beginning(15)
 
-# Insert nodes at the end
-llist.insert_at_end(20)
-llist.insert_at_end(25)
+    # Insert nodes at the end
+    llist.insert_at_end(20)
+    llist.insert_at_end(25)
 
-print("Linked list:")
-llist.print_list()
+    print("Linked list:")
+    llist.print_list()
 
-# Reverse
-llist.reverse()
-print("\nReversed linked list:")
-llist.print_list()
+    # Reverse
+    llist.reverse()
+    print("\nReversed linked list:")
+    llist.print_list()
 
-# Sort (merge sort)
-llist.merge_sort()
-print("\nSorted linked list:")
-llist.print_list()
+    # Sort (merge sort)
+    llist.merge_sort()
+    print("\nSorted linked list:")
+    llist.print_list()
 
-# Create two sorted lists and merge them
-a = LinkedList()
-for x in [1, 4, 7, 10]:
-    a.insert_at_end(x)
+    # Create two sorted lists and merge them
+    a = LinkedList()
+    for x in [1, 4, 7, 10]:
+        a.insert_at_end(x)
 
-b = LinkedList()
-for x in [2, 3, 8, 9, 11]:
-    b.insert_at_end(x)
+    b = LinkedList()
+    for x in [2, 3, 8, 9, 11]:
+        b.insert_at_end(x)
 
-merged = LinkedList.merge_sorted_lists(a, b)
-print("\nMerged sorted lists (A + B):")
-merged.print_list()
\ No newline at end of file
+    merged = LinkedList.merge_sorted_lists(a, b)
+    print("\nMerged sorted lists (A + B):")
+    merged.print_list()
\ No newline at end of file
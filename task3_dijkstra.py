@@ -4,6 +4,8 @@ from dataclasses import dataclass # to automatically generate __init__ and __rep
 from heapq import heappop, heappush
 from typing import Any
 
+import profiling
+
 
 @dataclass(frozen=True) # frozen=True to create immutable object
 class Edge:
@@ -41,6 +43,7 @@ class WeightedGraph:
         return list(self._adj.keys())
 
 # Dijkstra shortest paths using a binary heap (heapq)
+@profiling.hook("dijkstra")
 def dijkstra(graph: WeightedGraph, start: Any) -> tuple[dict[Any, float], dict[Any, Any | None]]:
     if start not in graph.nodes():
         graph.add_node(start)
@@ -52,12 +55,15 @@ def dijkstra(graph: WeightedGraph, start: Any) -> tuple[dict[Any, float], dict[A
 
     # Min-heap stores (distance_so_far, node)
     heap = [(0.0, start)]
+    pops = stale = pushes = 0
 
     while heap:
         cur_dist, u = heappop(heap)
+        pops += 1
 
         # Skip stale heap entries
         if cur_dist != dist[u]:
+            stale += 1
             continue
 
         # Relax edges
@@ -69,6 +75,11 @@ def dijkstra(graph: WeightedGraph, start: Any) -> tuple[dict[Any, float], dict[A
                 dist[v] = alt
                 prev[v] = u
                 heappush(heap, (alt, v))
+                pushes += 1
+
+    profiling.count("dijkstra.heap_pops", pops)
+    profiling.count("dijkstra.stale_pops", stale)
+    profiling.count("dijkstra.heap_pushes", pushes)
 
     return dist, prev
 
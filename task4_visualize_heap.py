@@ -1,7 +1,9 @@
 import uuid
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
+from collections import Counter, deque
+
+# networkx and matplotlib are imported inside the drawing functions,
+# so the heap logic can be imported without them (and without their import time)
 
 
 class Node:
@@ -35,6 +37,9 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
 
 def draw_tree(tree_root: Node) -> None:
     # Draw a binary tree
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
     add_edges(tree, tree_root, pos)
@@ -81,7 +86,371 @@ def visualize_heap(values: list[int]) -> None:
     draw_tree(root)
 
 
+# Event kinds recorded by InstrumentedHeap. Events are plain tuples so the log stays compact:
+#   ("op", name)               start of a public operation (push, pop, pushpop, replace, heapify, merge)
+#   ("append", index, value)   new leaf stored at index
+#   ("set", index, value)      value at index overwritten
+#   ("move", src, dst)         heap[dst] = heap[src]
+#   ("truncate", length)       array cut down to length
+#   ("cmp", i, j)              heap[i] compared with heap[j] (j is None: with the incoming pushpop value)
+#   ("swap", i, j)             heap[i] and heap[j] exchanged
+#   ("sift", (i0, i1, ...))    full path travelled by one sift-up / sift-down
+EV_OP = "op"
+EV_APPEND = "append"
+EV_SET = "set"
+EV_MOVE = "move"
+EV_TRUNCATE = "truncate"
+EV_CMP = "cmp"
+EV_SWAP = "swap"
+EV_SIFT = "sift"
+
+
+def apply_heap_event(heap: list, event: tuple) -> None:
+    # Apply one logged event to a heap array (compare/op/sift events change nothing)
+    kind = event[0]
+    if kind == EV_APPEND:
+        heap.append(event[2])
+    elif kind == EV_SET:
+        heap[event[1]] = event[2]
+    elif kind == EV_MOVE:
+        heap[event[2]] = heap[event[1]]
+    elif kind == EV_TRUNCATE:
+        del heap[event[1]:]
+    elif kind == EV_SWAP:
+        i, j = event[1], event[2]
+        heap[i], heap[j] = heap[j], heap[i]
+
+
+class InstrumentedHeap:
+    """
+    Binary min-heap that counts its own work.
+
+    Counters (operation counts, compares, swaps, sift-depth histogram) are always kept
+    and cost a few integer increments per step; this is the production setting.
+    The event log is opt-in (record=True, for debugging and animate_heap_log) and keeps
+    only the last max_events events (None = unbounded). When old events are dropped
+    they are applied to log_base, so log_base + events always replays to the heap.
+    """
+
+    def __init__(self, values=None, *, record: bool = False, max_events: int | None = 10_000):
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be None or at least 1.")
+
+        self.heap = []
+        self.events = deque() if record else None
+        self.max_events = max_events
+        self.log_base = []  # heap array right before the first event in self.events
+
+        self.compares = 0
+        self.swaps = 0
+        self.op_counts = Counter()
+        self.sift_depths = Counter()
+
+        if values:
+            self.heapify(values)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def peek(self):
+        return self.heap[0]
+
+    def clear_log(self) -> None:
+        # Start a fresh event log from the current heap state
+        self.log_base = self.heap[:]
+        if self.events is not None:
+            self.events.clear()
+
+    def stats(self) -> dict:
+        # Snapshot of counters (suitable for metrics export)
+        return {
+            "size": len(self.heap),
+            "ops": dict(self.op_counts),
+            "compares": self.compares,
+            "swaps": self.swaps,
+            "sift_depths": dict(sorted(self.sift_depths.items())),
+        }
+
+    # --- public operations ---
+
+    def push(self, value) -> None:
+        self._begin("push")
+        self._push(value)
+
+    def _push(self, value) -> None:
+        self.heap.append(value)
+        self._log(EV_APPEND, len(self.heap) - 1, value)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        # Remove and return the smallest item
+        if not self.heap:
+            raise IndexError("pop from empty heap")
+
+        self._begin("pop")
+        top = self.heap[0]
+        last = self.heap.pop()
+
+        if self.heap:
+            self.heap[0] = last
+            self._log(EV_MOVE, len(self.heap), 0)
+            self._log(EV_TRUNCATE, len(self.heap))
+            self._sift_down(0)
+        else:
+            self._log(EV_TRUNCATE, 0)
+
+        return top
+
+    def replace(self, value):
+        # Pop the smallest item, then push value (heap size stays the same)
+        if not self.heap:
+            raise IndexError("replace on empty heap")
+
+        self._begin("replace")
+        top = self.heap[0]
+        self.heap[0] = value
+        self._log(EV_SET, 0, value)
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, value):
+        # Push value, then pop the smallest item (faster than push + pop)
+        self._begin("pushpop")
+        if not self.heap:
+            return value
+
+        self.compares += 1
+        self._log(EV_CMP, 0, None)
+        if not self.heap[0] < value:
+            return value
+
+        top = self.heap[0]
+        self.heap[0] = value
+        self._log(EV_SET, 0, value)
+        self._sift_down(0)
+        return top
+
+    def heapify(self, values) -> None:
+        # Replace heap contents with values and restore the heap property bottom-up
+        self._begin("heapify")
+        self.heap = []
+        self._log(EV_TRUNCATE, 0)
+        for v in values:
+            self.heap.append(v)
+            self._log(EV_APPEND, len(self.heap) - 1, v)
+        self._heapify_from(len(self.heap) // 2 - 1)
+
+    def merge(self, values) -> None:
+        # Bulk insert: one push per item for small batches, bottom-up rebuild for large ones
+        values = list(values)
+        self._begin("merge")
+        if len(values) * 4 < len(self.heap):
+            for v in values:
+                self._push(v)
+            return
+
+        for v in values:
+            self.heap.append(v)
+            self._log(EV_APPEND, len(self.heap) - 1, v)
+        self._heapify_from(len(self.heap) // 2 - 1)
+
+    # --- internals ---
+
+    def _begin(self, name: str) -> None:
+        self.op_counts[name] += 1
+        self._log(EV_OP, name)
+
+    def _log(self, *event) -> None:
+        events = self.events
+        if events is None:
+            return
+        if self.max_events is not None and len(events) >= self.max_events:
+            # Move the replay base forward past the event that falls off
+            apply_heap_event(self.log_base, events.popleft())
+        events.append(event)
+
+    def _heapify_from(self, start: int) -> None:
+        for i in range(start, -1, -1):
+            self._sift_down(i)
+
+    # The sift loops keep compares/swaps in locals and only touch the log when recording,
+    # so the counters-only (production) path stays a tight loop.
+
+    def _sift_up(self, i: int) -> None:
+        heap = self.heap
+        log = self._log if self.events is not None else None
+        compares = swaps = 0
+        path = [i]
+        while i > 0:
+            parent = (i - 1) // 2
+            compares += 1
+            if log:
+                log(EV_CMP, i, parent)
+            if not heap[i] < heap[parent]:
+                break
+            heap[i], heap[parent] = heap[parent], heap[i]
+            swaps += 1
+            if log:
+                log(EV_SWAP, i, parent)
+            i = parent
+            path.append(i)
+        self.compares += compares
+        self.swaps += swaps
+        self._end_sift(path)
+
+    def _sift_down(self, i: int) -> None:
+        heap = self.heap
+        log = self._log if self.events is not None else None
+        compares = swaps = 0
+        n = len(heap)
+        path = [i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n:
+                compares += 1
+                if log:
+                    log(EV_CMP, right, child)
+                if heap[right] < heap[child]:
+                    child = right
+            compares += 1
+            if log:
+                log(EV_CMP, child, i)
+            if not heap[child] < heap[i]:
+                break
+            heap[i], heap[child] = heap[child], heap[i]
+            swaps += 1
+            if log:
+                log(EV_SWAP, i, child)
+            i = child
+            path.append(i)
+        self.compares += compares
+        self.swaps += swaps
+        self._end_sift(path)
+
+    def _end_sift(self, path: list[int]) -> None:
+        self.sift_depths[len(path) - 1] += 1
+        if self.events is not None:
+            self._log(EV_SIFT, tuple(path))
+
+
+def heap_index_positions(n: int) -> list[tuple[float, float]]:
+    # Plot positions for heap indices 0..n-1 (same layout as add_edges)
+    pos = [(0.0, 0.0)] * n
+    for i in range(1, n):
+        parent = (i - 1) // 2
+        px, py = pos[parent]
+        layer = (parent + 1).bit_length()  # root is layer 1
+        offset = 1 / (2 ** layer)
+        pos[i] = (px - offset if i % 2 == 1 else px + offset, py - 1)
+    return pos
+
+
+def animate_heap_log(base: list, events, delay: float = 0.5, tween_frames: int = 4) -> None:
+    """
+    Replay an InstrumentedHeap event log.
+    Every heap value is a persistent node; a swap or move only animates the nodes involved,
+    the rest of the tree stays where it is.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    next_id = 0
+    slots = []   # slots[index] -> node id currently stored at that heap index
+    labels = {}  # node id -> value
+
+    def new_node(value) -> int:
+        nonlocal next_id
+        next_id += 1
+        labels[next_id] = value
+        return next_id
+
+    for v in base:
+        slots.append(new_node(v))
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plt.ion()
+
+    title = "heap"
+
+    def draw(highlight=(), moving=None) -> None:
+        # moving: {node_id: (x, y)} overrides for nodes in flight
+        positions = heap_index_positions(len(slots))
+        tree = nx.DiGraph()
+        pos = {}
+        for i, node_id in enumerate(slots):
+            tree.add_node(node_id)
+            pos[node_id] = positions[i]
+            if i > 0:
+                tree.add_edge(slots[(i - 1) // 2], node_id)
+        if moving:
+            pos.update(moving)
+
+        colors = ["#FF8C00" if n in highlight else "skyblue" for n in tree.nodes()]
+        ax.clear()
+        ax.set_title(title)
+        nx.draw(tree, pos=pos, labels={n: labels[n] for n in tree.nodes()}, arrows=False,
+                node_size=1500, node_color=colors, ax=ax)
+        plt.pause(delay / tween_frames)
+
+    def tween(moves: dict[int, tuple[int, int]]) -> None:
+        # moves: {node_id: (from_index, to_index)}; only these nodes are animated
+        positions = heap_index_positions(len(slots))
+        for f in range(1, tween_frames + 1):
+            t = f / tween_frames
+            moving = {}
+            for node_id, (a, b) in moves.items():
+                (ax0, ay0), (bx0, by0) = positions[a], positions[b]
+                moving[node_id] = (ax0 + (bx0 - ax0) * t, ay0 + (by0 - ay0) * t)
+            draw(highlight=moves.keys(), moving=moving)
+
+    for ev in events:
+        kind = ev[0]
+        if kind == EV_OP:
+            title = f"heap: {ev[1]}"
+        elif kind == EV_APPEND:
+            slots.append(new_node(ev[2]))
+            draw(highlight={slots[-1]})
+        elif kind == EV_SET:
+            slots[ev[1]] = new_node(ev[2])
+            draw(highlight={slots[ev[1]]})
+        elif kind == EV_MOVE:
+            src, dst = ev[1], ev[2]
+            tween({slots[src]: (src, dst)})
+            slots[dst] = slots[src]
+        elif kind == EV_TRUNCATE:
+            del slots[ev[1]:]
+            draw()
+        elif kind == EV_CMP:
+            draw(highlight={slots[i] for i in ev[1:] if i is not None})
+        elif kind == EV_SWAP:
+            i, j = ev[1], ev[2]
+            tween({slots[i]: (i, j), slots[j]: (j, i)})
+            slots[i], slots[j] = slots[j], slots[i]
+        # EV_SIFT only summarises the swaps above, nothing to draw
+
+    draw()
+    plt.ioff()
+
+
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     # Test case
     data = [10, 4, 5, 1, 3, 8, 2, 9, 7, 6]
-    visualize_heap(data)
\ No newline at end of file
+    visualize_heap(data)
+
+    # Instrumented heap: replay push / pop / pushpop / replace / merge step by step
+    h = InstrumentedHeap(data, record=True)
+    h.clear_log()
+    h.push(0)
+    h.pop()
+    h.pushpop(5)
+    h.replace(11)
+    h.merge([12, 2, 6])
+    print(h.stats())
+
+    animate_heap_log(h.log_base, h.events)
+    plt.show()
\ No newline at end of file
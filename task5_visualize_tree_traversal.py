@@ -2,8 +2,10 @@ import uuid
 import heapq
 from collections import deque
 
-import networkx as nx
-import matplotlib.pyplot as plt
+import profiling
+
+# networkx and matplotlib are imported inside the drawing functions,
+# so the traversal logic can be imported without them (and without their import time)
 
 
 class Node:
@@ -35,8 +37,11 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
     return graph
 
 
+@profiling.hook("tree_layout")
 def build_nx_tree_and_pos(tree_root: Node):
     # Build NetworkX graph and positions once (so it doesn't recompute every frame)
+    import networkx as nx
+
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
     add_edges(tree, tree_root, pos)
@@ -45,6 +50,8 @@ def build_nx_tree_and_pos(tree_root: Node):
 
 def draw_tree_frame(tree, pos, tree_root: Node, ax, title: str) -> None:
     # Draw a single frame into an existing matplotlib axes
+    import networkx as nx
+
     ax.clear()
     ax.set_title(title)
 
@@ -177,6 +184,8 @@ def bfs_queue(root: Node) -> list[Node]:
 
 def visualize_traversal_steps(root: Node, visit_order: list[Node], traversal_name: str, delay: float = 0.8) -> None:
     # Animate traversal in a single window using pause()
+    import matplotlib.pyplot as plt
+
     total = len(visit_order)
     palette = hex_gradient(total, start_hex="#0B2545", end_hex="#BFEFFF")
 
@@ -211,6 +220,8 @@ def visualize_traversal_steps(root: Node, visit_order: list[Node], traversal_nam
 
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     # Build a heap - convert to tree - visualize
     values = [10, 4, 5, 1, 3, 8, 2, 9, 7, 6]
     heap = heapify_list(values)
@@ -1,3 +1,13 @@
+import argparse
+import math
+import random
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from fractions import Fraction
+
+import profiling
+
 items = {
     "pizza": {"cost": 50, "calories": 300},
     "hamburger": {"cost": 40, "calories": 250},
@@ -7,18 +17,22 @@ items = {
     "potato": {"cost": 25, "calories": 350},
 }
 
+def sorted_by_ratio(items: dict) -> list[tuple[str, dict]]:
+    # Sort items by calories/cost, best first (free items go first)
+    return sorted(
+        items.items(),
+        key=lambda x: x[1]["calories"] / x[1]["cost"] if x[1]["cost"] else float("inf"),
+        reverse=True,
+    )
+
+@profiling.hook("knapsack.greedy")
 def greedy_algorithm(items: dict, budget: int) -> tuple[list[str], int, int]:
     """
     Greedy approach:
     Select items by highest calories-to-cost ratio.
     This method is fast but NOT guaranteed to be optimal.
     """
-    # Sort items by calories/cost
-    sorted_items = sorted(
-        items.items(),
-        key=lambda x: x[1]["calories"] / x[1]["cost"],
-        reverse=True,
-    )
+    sorted_items = sorted_by_ratio(items)
 
     total_cost = 0
     total_calories = 0
@@ -32,11 +46,70 @@ def greedy_algorithm(items: dict, budget: int) -> tuple[list[str], int, int]:
 
     return chosen, total_cost, total_calories
 
-def dynamic_programming(items: dict, budget: int) -> tuple[list[str], int, int]:
+@profiling.hook("knapsack.dynamic_programming")
+def dynamic_programming(items: dict, budget: int, mode: str = "table") -> tuple[list[str], int, int]:
     """
     Dynamic programming approach (0/1 Knapsack).
     Guarantees optimal solution.
+
+    mode:
+      "table"      - full (n+1) x (budget+1) table
+      "rolling"    - one rolling row + packed bitset of choices (n*budget bits)
+      "hirschberg" - divide and conquer, O(budget * log n) memory
+      "numpy"      - rolling row updated with vectorised NumPy operations
+      "pareto"     - sparse list of non-dominated (cost, calories) states, no table at all
+      "bnb"        - branch and bound (see branch_and_bound), no table at all
+
+    Table-based modes work on costs divided by their GCD (see scale_costs), so prices
+    with cents and large budgets with a common unit still give a small table.
+    """
+    if mode == "pareto":
+        return dp_pareto(items, budget)
+    if mode == "bnb":
+        return branch_and_bound(items, budget)[:3]
+
+    engines = {
+        "table": dp_table,
+        "rolling": dp_rolling_bitset,
+        "hirschberg": dp_hirschberg,
+        "numpy": dp_numpy,
+    }
+    if mode not in engines:
+        raise ValueError(f"Unknown DP mode: {mode!r}")
+
+    scaled_items, scaled_budget = scale_costs(items, budget)
+    chosen, _, total_calories = engines[mode](scaled_items, scaled_budget)
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    return chosen, total_cost, total_calories
+
+def _as_fraction(value) -> Fraction:
+    # Exact value of a cost; floats go through str() so 0.1 means 1/10
+    if isinstance(value, float):
+        return Fraction(str(value))
+    return Fraction(value)
+
+def scale_costs(items: dict, budget) -> tuple[dict, int]:
+    """
+    Express costs and budget in the largest common cost unit (GCD of all costs).
+    Example: costs 12.50 and 7.25 -> unit 0.25 -> integer costs 50 and 29.
+    The budget is rounded down to whole units.
     """
+    unit = cost_unit(items)
+    scaled = {name: {**data, "cost": int(_as_fraction(data["cost"]) / unit)} for name, data in items.items()}
+    return scaled, math.floor(_as_fraction(budget) / unit)
+
+def cost_unit(items: dict) -> Fraction:
+    # Largest value that divides every cost exactly (1 if all costs are zero)
+    costs = [_as_fraction(data["cost"]) for data in items.values()]
+
+    denominator = math.lcm(*(c.denominator for c in costs))
+    numerator = math.gcd(*(int(c * denominator) for c in costs))
+    return Fraction(numerator, denominator) if numerator else Fraction(1)
+
+@profiling.hook("knapsack.dp_table")
+def dp_table(items: dict, budget: int) -> tuple[list[str], int, int]:
+    # Classic full-table 0/1 Knapsack (integer costs)
     names = list(items.keys())
     n = len(names)
 
@@ -72,8 +145,571 @@ def dynamic_programming(items: dict, budget: int) -> tuple[list[str], int, int]:
 
     return chosen, total_cost, total_calories
 
-if __name__ == "__main__":
-    budget = 100
+@profiling.hook("knapsack.dp_rolling_bitset")
+def dp_rolling_bitset(items: dict, budget: int) -> tuple[list[str], int, int]:
+    """
+    0/1 Knapsack with a single rolling row of values.
+    For reconstruction, each item keeps one bit per budget value (1 = item taken),
+    packed into a bytearray: n * (budget + 1) / 8 bytes instead of a table of ints.
+    Picks exactly the same items as the "table" mode.
+    """
+    names = list(items.keys())
+    row = [0] * (budget + 1)
+    taken = []
+
+    for name in names:
+        cost = items[name]["cost"]
+        calories = items[name]["calories"]
+        bits = bytearray((budget >> 3) + 1)
+
+        # Go from high budget to low so row[w - cost] still holds the previous item's value
+        for w in range(budget, cost - 1, -1):
+            candidate = row[w - cost] + calories
+            if candidate > row[w]:
+                row[w] = candidate
+                bits[w >> 3] |= 1 << (w & 7)
+
+        taken.append(bits)
+
+    # Restore chosen items
+    w = budget
+    chosen = []
+    for i in range(len(names) - 1, -1, -1):
+        if taken[i][w >> 3] >> (w & 7) & 1:
+            chosen.append(names[i])
+            w -= items[names[i]]["cost"]
+
+    chosen.reverse()
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    return chosen, total_cost, row[budget]
+
+def dp_numpy(items: dict, budget: int) -> tuple[list[str], int, int]:
+    """
+    0/1 Knapsack with NumPy: every item updates the whole row at once,
+    row = max(row, row shifted by cost + calories).
+    The "item taken" mask is kept with np.packbits, so reconstruction is exact
+    and picks the same items as the "table" mode.
+    """
+    return KnapsackChoices(items, budget).solve(budget)
+
+class KnapsackChoices:
+    """
+    Final DP row plus packed "item taken" bits of every item, built with NumPy
+    for all budgets 0..max_budget (integer costs).
+    The row is int64 for integer calories and float64 otherwise.
+    One build answers any budget up to max_budget with an O(n) reconstruction.
+    """
+
+    @profiling.hook("knapsack.build_choices")
+    def __init__(self, items: dict, max_budget: int):
+        # NumPy is only needed here; imported lazily to keep the module import light
+        import numpy as np
+
+        self.names = list(items.keys())
+        self.costs = [items[name]["cost"] for name in self.names]
+        self.max_budget = max_budget
+        integral = all(isinstance(items[name]["calories"], int) for name in self.names)
+        self.row = np.zeros(max_budget + 1, dtype=np.int64 if integral else np.float64)
+        self.taken = []
+
+        row = self.row
+        for name, cost in zip(self.names, self.costs):
+            calories = items[name]["calories"]
+            if cost > max_budget:
+                self.taken.append(None)
+                continue
+
+            # candidate[k] is the value at budget w = k + cost when the item is taken
+            candidate = row[: max_budget + 1 - cost] + calories
+            better = candidate > row[cost:]
+            np.maximum(row[cost:], candidate, out=row[cost:])
+            self.taken.append(np.packbits(better).tobytes())
+
+    def solve(self, budget: int) -> tuple[list[str], int, int]:
+        # Restore chosen items for one budget (nothing is affordable with a negative budget)
+        if budget > self.max_budget:
+            raise ValueError(f"Budget {budget} exceeds the built maximum {self.max_budget}")
+        if budget < 0:
+            return [], 0, 0
+
+        w = budget
+        total_cost = 0
+        chosen = []
+        for i in range(len(self.names) - 1, -1, -1):
+            bits = self.taken[i]
+            if bits is None:
+                continue
+            k = w - self.costs[i]
+            if k >= 0 and bits[k >> 3] >> (7 - (k & 7)) & 1:
+                chosen.append(self.names[i])
+                total_cost += self.costs[i]
+                w = k
+
+        chosen.reverse()
+        return chosen, total_cost, self.row[budget].item()
+
+# Built KnapsackChoices per menu version (see solve_many), most recently used last
+_choices_cache = OrderedDict()
+CHOICES_CACHE_SIZE = 8
+
+@profiling.hook("knapsack.solve_many")
+def solve_many(items: dict, budgets: list) -> list[tuple[list[str], int, int]]:
+    """
+    Answer many budgets for the same menu from a single DP pass.
+    The table is built once up to max(budgets) (costs scaled by their GCD) and every
+    budget is reconstructed from the shared choice bits. Builds are cached per menu
+    version (names, costs and calories), so repeated queries only pay O(n) per budget.
+    Results are in the order of budgets and match dynamic_programming(items, budget).
+    """
+    if not budgets:
+        return []
+
+    unit = cost_unit(items)
+    scaled_budgets = [math.floor(_as_fraction(b) / unit) for b in budgets]
+    max_budget = max(0, *scaled_budgets)
+
+    version = tuple((name, data["cost"], data["calories"]) for name, data in items.items())
+    choices = _choices_cache.get(version)
+    if choices is None or choices.max_budget < max_budget:
+        profiling.count("knapsack.solve_many_builds")
+        scaled_items = {
+            name: {**data, "cost": int(_as_fraction(data["cost"]) / unit)} for name, data in items.items()
+        }
+        choices = KnapsackChoices(scaled_items, max_budget)
+        _choices_cache[version] = choices
+        if len(_choices_cache) > CHOICES_CACHE_SIZE:
+            _choices_cache.popitem(last=False)
+    _choices_cache.move_to_end(version)
+
+    results = []
+    for b in scaled_budgets:
+        chosen, _, total_calories = choices.solve(b)
+        total_cost = sum(items[name]["cost"] for name in chosen)
+        results.append((chosen, total_cost, total_calories))
+    return results
+
+def _knapsack_row(items: dict, names: list[str], row: list) -> list:
+    # DP row after adding names to an existing row (the row itself is not modified)
+    row = row[:]
+    budget = len(row) - 1
+    for name in names:
+        cost = items[name]["cost"]
+        calories = items[name]["calories"]
+        for w in range(budget, cost - 1, -1):
+            candidate = row[w - cost] + calories
+            if candidate > row[w]:
+                row[w] = candidate
+    return row
+
+@profiling.hook("knapsack.dp_hirschberg")
+def dp_hirschberg(items: dict, budget: int) -> tuple[list[str], int, int]:
+    """
+    0/1 Knapsack reconstructed by divide and conquer (Hirschberg-style checkpoints).
+    Deciding items lo..hi needs only the DP row before lo: the row at the midpoint is
+    recomputed from it, the upper half is decided first (reconstruction runs from the
+    last item backwards, like the table), then the lower half with the budget left.
+    Only one row per recursion level is alive: O(budget * log n) memory instead of
+    O(n * budget), for O(n * budget * log n) work.
+    Picks exactly the same items as the "table" mode.
+    """
+    names = list(items.keys())
+    taken = [False] * len(names)
+
+    def solve(lo: int, hi: int, row: list, w: int) -> int:
+        # Decide items lo..hi-1 given row = DP row before item lo; returns the budget left
+        if hi - lo == 1:
+            cost = items[names[lo]]["cost"]
+            if cost <= w and row[w - cost] + items[names[lo]]["calories"] > row[w]:
+                taken[lo] = True
+                return w - cost
+            return w
+
+        mid = (lo + hi) // 2
+        mid_row = _knapsack_row(items, names[lo:mid], row)
+        w = solve(mid, hi, mid_row, w)
+        del mid_row
+
+        return solve(lo, mid, row, w)
+
+    if names:
+        solve(0, len(names), [0] * (budget + 1), budget)
+
+    chosen = [name for name, t in zip(names, taken) if t]
+
+    # Same additions in the same order as the table, so float calories match exactly
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    total_calories = sum(items[name]["calories"] for name in chosen)
+    return chosen, total_cost, total_calories
+
+@profiling.hook("knapsack.dp_pareto")
+def dp_pareto(items: dict, budget) -> tuple[list[str], int, int]:
+    """
+    0/1 Knapsack over the Pareto frontier of (cost, calories) states.
+    After each item only non-dominated states are kept (no other state is both
+    cheaper and higher in calories), so the work depends on the number of such
+    states, not on the size of the budget. Costs may be any numbers (ints, floats,
+    Decimal, Fraction): they are compared exactly, in integer units of scale_costs.
+    """
+    scaled_items, scaled_budget = scale_costs(items, budget)
+
+    # State: (cost, calories, chain); chain is a linked list (name, parent_chain) of chosen items
+    states = [(0, 0, None)]
+
+    for name, data in scaled_items.items():
+        cost = data["cost"]
+        calories = data["calories"]
+
+        shifted = [
+            (c + cost, v + calories, (name, chain))
+            for c, v, chain in states
+            if c + cost <= scaled_budget
+        ]
+
+        # Merge both cost-sorted lists; on equal cost, the higher calories (then "not taken") goes first
+        merged = []
+        i = j = 0
+        while i < len(states) or j < len(shifted):
+            if j == len(shifted) or (
+                i < len(states)
+                and (states[i][0], -states[i][1]) <= (shifted[j][0], -shifted[j][1])
+            ):
+                candidate = states[i]
+                i += 1
+            else:
+                candidate = shifted[j]
+                j += 1
+
+            # Keep only states that add calories over every cheaper state
+            if not merged or candidate[1] > merged[-1][1]:
+                merged.append(candidate)
+
+        states = merged
+        profiling.count("knapsack.pareto_states", len(states))
+
+    # Most calories is the last state on the frontier
+    _, total_calories, chain = states[-1]
+
+    chosen = []
+    while chain is not None:
+        chosen.append(chain[0])
+        chain = chain[1]
+    chosen.reverse()
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    return chosen, total_cost, total_calories
+
+@profiling.hook("knapsack.branch_and_bound")
+def branch_and_bound(
+    items: dict,
+    budget,
+    node_limit: int | None = None,
+    time_limit: float | None = None,
+    mitm_max_items: int = 24,
+) -> tuple[list[str], int, int, float]:
+    """
+    Exact 0/1 Knapsack by depth-first branch and bound.
+    Items are visited in greedy order (calories/cost) and every node is bounded by the
+    fractional greedy relaxation, so most of the tree is cut off early. The greedy
+    solution is the first incumbent.
+
+    node_limit / time_limit (seconds) stop the search early: the best solution found
+    so far is returned together with the optimality gap (upper_bound - best) / upper_bound,
+    which is 0.0 when the solution is proven optimal.
+    Menus with at most mitm_max_items items are solved by meet_in_the_middle instead
+    (cost does not depend on the budget).
+
+    Returns (chosen, total_cost, total_calories, gap).
+    """
+    if len(items) <= mitm_max_items:
+        chosen, total_cost, total_calories = meet_in_the_middle(items, budget)
+        return chosen, total_cost, total_calories, 0.0
+
+    # Work in exact integer cost units (see scale_costs), report costs in original units
+    scaled_items, budget = scale_costs(items, budget)
+
+    # Items that can never fit are dropped up front
+    order = [(name, data) for name, data in sorted_by_ratio(scaled_items) if data["cost"] <= budget]
+    names = [name for name, _ in order]
+    costs = [data["cost"] for _, data in order]
+    calories = [data["calories"] for _, data in order]
+    n = len(names)
+
+    prefix_cost = [0]
+    prefix_calories = [0]
+    for c, v in zip(costs, calories):
+        prefix_cost.append(prefix_cost[-1] + c)
+        prefix_calories.append(prefix_calories[-1] + v)
+
+    # With integer calories a bound of 41.7 means at most 41
+    integral = all(isinstance(v, int) for v in calories)
+
+    def upper_bound(level: int, cost, value):
+        # Fill the remaining budget greedily from item "level", the last item fractionally
+        cap = budget - cost
+        k = bisect_right(prefix_cost, prefix_cost[level] + cap, lo=level) - 1
+        bound = value + prefix_calories[k] - prefix_calories[level]
+        if k < n:
+            bound += (cap - (prefix_cost[k] - prefix_cost[level])) * calories[k] / costs[k]
+        return math.floor(bound) if integral else bound
+
+    # Greedy solution as the first incumbent
+    best_cost = best_calories = 0
+    best_chain = None
+    for i in range(n):
+        if best_cost + costs[i] <= budget:
+            best_cost += costs[i]
+            best_calories += calories[i]
+            best_chain = (names[i], best_chain)
+
+    # Stack node: (bound, level, cost, calories, chain); LIFO = depth first
+    stack = [(upper_bound(0, 0, 0), 0, 0, 0, None)]
+    nodes = 0
+    start = time.perf_counter()
+
+    while stack:
+        if node_limit is not None and nodes >= node_limit:
+            break
+        if time_limit is not None and nodes % 1024 == 0 and time.perf_counter() - start > time_limit:
+            break
+
+        bound, level, cost, value, chain = stack.pop()
+        if bound <= best_calories or level == n:
+            continue
+        nodes += 1
+
+        # Push "skip" first so the "take" branch is explored first
+        skip_bound = upper_bound(level + 1, cost, value)
+        if skip_bound > best_calories:
+            stack.append((skip_bound, level + 1, cost, value, chain))
+
+        new_cost = cost + costs[level]
+        if new_cost <= budget:
+            new_value = value + calories[level]
+            new_chain = (names[level], chain)
+            if new_value > best_calories:
+                best_cost, best_calories, best_chain = new_cost, new_value, new_chain
+
+            take_bound = upper_bound(level + 1, new_cost, new_value)
+            if take_bound > best_calories:
+                stack.append((take_bound, level + 1, new_cost, new_value, new_chain))
+
+    profiling.count("knapsack.bnb_nodes", nodes)
+
+    # Open nodes left behind by a limit bound the true optimum
+    upper = max([best_calories] + [node[0] for node in stack])
+    gap = (upper - best_calories) / upper if upper > 0 else 0.0
+
+    chosen = []
+    while best_chain is not None:
+        chosen.append(best_chain[0])
+        best_chain = best_chain[1]
+
+    # Report items in menu order, like the DP modes
+    position = {name: i for i, name in enumerate(items)}
+    chosen.sort(key=position.get)
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    return chosen, total_cost, best_calories, gap
+
+@profiling.hook("knapsack.meet_in_the_middle")
+def meet_in_the_middle(items: dict, budget) -> tuple[list[str], int, int]:
+    """
+    Exact 0/1 Knapsack for small menus: enumerate all subsets of each half
+    (2^(n/2) each), keep the Pareto frontier of the second half and binary search it
+    for every subset of the first half. Cost does not depend on the budget.
+    Costs are compared exactly, in integer units of scale_costs.
+    """
+    scaled_items, budget = scale_costs(items, budget)
+    names = list(items.keys())
+    half = len(names) // 2
+
+    def subsets(part: list[str]) -> list[tuple]:
+        # All affordable subsets as (cost, calories, mask of part indices)
+        out = [(0, 0, 0)]
+        for j, name in enumerate(part):
+            cost = scaled_items[name]["cost"]
+            calories = scaled_items[name]["calories"]
+            out += [
+                (c + cost, v + calories, mask | 1 << j)
+                for c, v, mask in out
+                if c + cost <= budget
+            ]
+        return out
+
+    left_part, right_part = names[:half], names[half:]
+    left = subsets(left_part)
+    right = subsets(right_part)
+
+    # Frontier of the right half: cost ascending, calories strictly increasing
+    right.sort(key=lambda s: (s[0], -s[1]))
+    frontier = []
+    for state in right:
+        if not frontier or state[1] > frontier[-1][1]:
+            frontier.append(state)
+    frontier_costs = [state[0] for state in frontier]
+
+    best = (0, 0, 0, 0)  # (calories, cost, left mask, right mask)
+    for c, v, mask in left:
+        k = bisect_right(frontier_costs, budget - c) - 1
+        if k < 0:
+            continue
+        total = v + frontier[k][1]
+        if total > best[0]:
+            best = (total, c + frontier[k][0], mask, frontier[k][2])
+
+    total_calories, _, left_mask, right_mask = best
+    chosen = [name for j, name in enumerate(left_part) if left_mask >> j & 1]
+    chosen += [name for j, name in enumerate(right_part) if right_mask >> j & 1]
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+
+    return chosen, total_cost, total_calories
+
+def max_copies(data: dict, budget) -> int:
+    """
+    How many copies of an item may be bought.
+    "quantity" key: missing -> 1 (0/1 Knapsack), an int -> at most that many, None -> unlimited.
+    Unlimited items are capped by what the budget can pay for.
+    """
+    quantity = data.get("quantity", 1)
+    cost = data["cost"]
+
+    if quantity is None:
+        if cost <= 0:
+            if data["calories"] > 0:
+                raise ValueError("Unlimited free item with positive calories has no optimum.")
+            return 0
+        return max(0, math.floor(budget / cost))
+
+    return quantity
+
+def greedy_quantities(items: dict, budget) -> tuple[list[str], int, int, dict[str, int]]:
+    """
+    Greedy approach with quantities:
+    take as many copies of the best calories-to-cost item as fit, then the next one.
+    Copy limits are computed exactly, in integer units of scale_costs.
+    Returns (chosen, total_cost, total_calories, counts).
+    """
+    scaled_items, scaled_budget = scale_costs(items, budget)
+
+    spent = 0  # in scaled units
+    total_cost = 0
+    total_calories = 0
+    counts = {}
+
+    for name, data in sorted_by_ratio(scaled_items):
+        cost = data["cost"]
+        copies = max_copies(data, scaled_budget)
+        if cost > 0:
+            copies = min(copies, (scaled_budget - spent) // cost)
+
+        if copies > 0:
+            counts[name] = copies
+            spent += copies * cost
+            total_cost += copies * items[name]["cost"]
+            total_calories += copies * data["calories"]
+
+    chosen = list(counts)
+    return chosen, total_cost, total_calories, counts
+
+@profiling.hook("knapsack.dp_quantities")
+def dp_quantities(items: dict, budget) -> tuple[list[str], int, int, dict[str, int]]:
+    """
+    Knapsack with quantities ("quantity" key, see max_copies).
+    Each item with up to q copies is split into 0/1 pieces of 1, 2, 4, ..., rest copies,
+    so any count 0..q is a sum of pieces and the DP does O(n * budget * log q) work
+    instead of expanding q copies. Unlimited items use q = budget // cost.
+    Returns (chosen, total_cost, total_calories, counts); chosen is in menu order.
+    """
+    scaled_items, scaled_budget = scale_costs(items, budget)
+
+    # Binary pieces keyed by (name, piece number); copies[key] = copies in that piece
+    pieces = {}
+    copies = {}
+    for name, data in scaled_items.items():
+        remaining = max_copies(data, scaled_budget)
+        k = 1
+        while remaining > 0:
+            take = min(k, remaining)
+            key = (name, len(copies))
+            pieces[key] = {"cost": data["cost"] * take, "calories": data["calories"] * take}
+            copies[key] = take
+            remaining -= take
+            k *= 2
+
+    chosen_pieces, _, total_calories = KnapsackChoices(pieces, scaled_budget).solve(scaled_budget)
+
+    counts = {}
+    for key in chosen_pieces:
+        counts[key[0]] = counts.get(key[0], 0) + copies[key]
+    chosen = [name for name in items if name in counts]
+    counts = {name: counts[name] for name in chosen}
+
+    total_cost = sum(items[name]["cost"] * count for name, count in counts.items())
+    return chosen, total_cost, total_calories, counts
+
+def random_menu(n: int, max_cost: int, seed: int | None = None) -> dict:
+    # Random menu in the same format as items (for benchmarks)
+    rng = random.Random(seed)
+    return {
+        f"item{i}": {"cost": rng.randint(1, max_cost), "calories": rng.randint(1, 1000)}
+        for i in range(n)
+    }
+
+def benchmark_dp(
+    item_counts: list[int],
+    budgets: list[int],
+    modes: tuple[str, ...] = ("table", "numpy", "bnb"),
+    seed: int = 0,
+) -> list[dict]:
+    # Time dynamic_programming modes on random menus, one run per (n, budget, mode)
+    results = []
+    for n in item_counts:
+        for budget in budgets:
+            menu = random_menu(n, max_cost=max(1, budget // 4), seed=seed)
+            expected = None
+            for mode in modes:
+                start = time.perf_counter()
+                result = dynamic_programming(menu, budget, mode=mode)
+                elapsed = time.perf_counter() - start
+
+                if expected is None:
+                    expected = result[2]
+                elif result[2] != expected:
+                    raise AssertionError(f"{mode} gave {result[2]} calories, expected {expected}")
+
+                results.append({"items": n, "budget": budget, "mode": mode, "seconds": elapsed})
+    return results
+
+def print_benchmark(results: list[dict]) -> None:
+    # Print benchmark table with speedup relative to the first mode of each (items, budget) group
+    print(f"{'Items':>6} | {'Budget':>8} | {'Mode':>10} | {'Seconds':>9} | {'Speedup':>8}")
+    print("-" * 54)
+    baseline = {}
+    for r in results:
+        key = (r["items"], r["budget"])
+        baseline.setdefault(key, r["seconds"])
+        speedup = baseline[key] / r["seconds"] if r["seconds"] else float("inf")
+        print(f"{r['items']:>6} | {r['budget']:>8} | {r['mode']:>10} | {r['seconds']:>9.4f} | {speedup:>7.1f}x")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Greedy vs dynamic programming for the food knapsack.")
+    parser.add_argument("--budget", type=int, default=100, help="Budget for the demo menu")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark DP modes on random menus")
+    parser.add_argument(
+        "--quantity",
+        type=int,
+        default=None,
+        help="Allow up to this many copies of every item (0 = unlimited)",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print_benchmark(benchmark_dp(item_counts=[10, 100, 300], budgets=[1_000, 10_000, 30_000]))
+        return
+
+    budget = args.budget
 
     greedy_result = greedy_algorithm(items, budget)
     dp_result = dynamic_programming(items, budget)
@@ -86,4 +722,20 @@ if __name__ == "__main__":
     print("\nDynamic programming result:")
     print(f"Items: {dp_result[0]}")
     print(f"Total cost: {dp_result[1]}")
-    print(f"Total calories: {dp_result[2]}")
\ No newline at end of file
+    print(f"Total calories: {dp_result[2]}")
+
+    if args.quantity is not None:
+        limit = args.quantity or None
+        menu = {name: {**data, "quantity": limit} for name, data in items.items()}
+
+        for title, result in (
+            ("Greedy algorithm with quantities", greedy_quantities(menu, budget)),
+            ("Dynamic programming with quantities", dp_quantities(menu, budget)),
+        ):
+            print(f"\n{title} (limit: {limit or 'unlimited'}):")
+            print(f"Items: {result[3]}")
+            print(f"Total cost: {result[1]}")
+            print(f"Total calories: {result[2]}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
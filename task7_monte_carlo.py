@@ -1,10 +1,19 @@
 import argparse
+import json
+import os
 import random
+import sys
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 
-import matplotlib.pyplot as plt
+import numpy as np
 
+import profiling
 
+
+@profiling.hook("dice.simulate_two_dice")
 def simulate_two_dice(trials: int, seed: int | None = None) -> dict[int, float]:
     # Simulate rolling two fair dice "trials" times and estimate probabilities for sums 2..12
     if seed is not None:
@@ -21,20 +30,243 @@ def simulate_two_dice(trials: int, seed: int | None = None) -> dict[int, float]:
     return probs
 
 
-def analytical_probabilities() -> dict[int, float]:
-    # Exact probabilities for sums of two fair dice (out of 36 equally likely outcomes)
-    ways = {
-        2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6,
-        8: 5, 9: 4, 10: 3, 11: 2, 12: 1
-    }
-    return {s: ways[s] / 36 for s in range(2, 13)}
+@profiling.hook("dice.count_dice_sums")
+def count_dice_sums(
+    trials: int,
+    rng: np.random.Generator,
+    dice: int = 2,
+    faces: int = 6,
+    chunk_size: int = 1_000_000,
+) -> np.ndarray:
+    """
+    Roll "dice" fair dice with "faces" faces "trials" times using NumPy.
+    Rolls are drawn in chunks of chunk_size, so memory stays constant for any number of trials.
+    Returns counts indexed by sum: counts[s] = how many times the dice summed to s.
+    """
+    min_sum = dice
+    counts = np.zeros(dice * faces + 1, dtype=np.int64)
+
+    done = 0
+    while done < trials:
+        m = min(chunk_size, trials - done)
+
+        # Sum of zero-based faces, one die at a time (one chunk-sized array alive)
+        sums = rng.integers(0, faces, size=m, dtype=np.int64)
+        for _ in range(dice - 1):
+            sums += rng.integers(0, faces, size=m, dtype=np.int64)
+
+        counts[min_sum:] += np.bincount(sums, minlength=dice * (faces - 1) + 1)
+        done += m
+        profiling.count("dice.chunks")
+
+    return counts
+
+
+def _count_worker(task: tuple) -> np.ndarray:
+    # Process pool entry point: one independent stream per worker
+    trials, seed_seq, dice, faces, chunk_size = task
+    rng = np.random.default_rng(seed_seq)
+    return count_dice_sums(trials, rng, dice=dice, faces=faces, chunk_size=chunk_size)
+
+
+@profiling.hook("dice.count_dice_sums_parallel")
+def count_dice_sums_parallel(
+    trials: int,
+    workers: int = 1,
+    dice: int = 2,
+    faces: int = 6,
+    seed: int | None = None,
+    chunk_size: int = 1_000_000,
+) -> np.ndarray:
+    """
+    Split trials across "workers" processes and merge their count arrays.
+    Every worker gets its own stream spawned from one SeedSequence(seed), so for a
+    given seed, worker count and chunk size the result is bit-identical run to run.
+    workers=1 runs in the current process with the same stream as worker 0.
+    """
+    streams = np.random.SeedSequence(seed).spawn(workers)
+
+    # First trials % workers workers take one extra trial
+    base, extra = divmod(trials, workers)
+    tasks = [
+        (base + (1 if i < extra else 0), streams[i], dice, faces, chunk_size)
+        for i in range(workers)
+    ]
+
+    if workers == 1:
+        return _count_worker(tasks[0])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_count_worker, tasks))
+
+    return np.sum(parts, axis=0)
+
+
+def simulate_dice_numpy(
+    trials: int,
+    dice: int = 2,
+    faces: int = 6,
+    seed: int | None = None,
+    chunk_size: int = 1_000_000,
+    workers: int = 1,
+) -> dict[int, float]:
+    # Vectorised Monte Carlo: estimate probabilities for sums dice..dice*faces
+    counts = count_dice_sums_parallel(
+        trials, workers=workers, dice=dice, faces=faces, seed=seed, chunk_size=chunk_size
+    )
+    return {s: counts[s] / trials for s in range(dice, dice * faces + 1)}
+
+
+def benchmark_workers(
+    trials: int,
+    worker_counts: list[int],
+    dice: int = 2,
+    faces: int = 6,
+    chunk_size: int = 1_000_000,
+) -> list[dict]:
+    # Time the numpy engine for each worker count (same seed everywhere)
+    results = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count_dice_sums_parallel(trials, workers=workers, dice=dice, faces=faces, seed=0, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+
+        rate = trials / elapsed
+        results.append({
+            "workers": workers,
+            "seconds": elapsed,
+            "trials_per_second": rate,
+            "trials_per_second_per_core": rate / workers,
+        })
+    return results
+
+
+def print_benchmark(results: list[dict]) -> None:
+    # Print scaling table: throughput in total and per core, speedup vs the first row
+    print(f"{'Workers':>7} | {'Seconds':>8} | {'Trials/s':>12} | {'Trials/s/core':>13} | {'Speedup':>7}")
+    print("-" * 60)
+    base = results[0]["seconds"]
+    for r in results:
+        print(
+            f"{r['workers']:>7} | {r['seconds']:>8.3f} | {r['trials_per_second']:>12.3e} | "
+            f"{r['trials_per_second_per_core']:>13.3e} | {base / r['seconds']:>6.2f}x"
+        )
+
+
+def analytical_probabilities(dice: int = 2, faces: int = 6) -> dict[int, float]:
+    """
+    Exact probabilities for sums of fair dice.
+    ways[s] (number of outcomes with sum s) is built by convolving the single-die
+    distribution "dice" times with integer arithmetic, then divided by faces ** dice.
+    Two six-sided dice give the classic 1..6..1 out of 36.
+    """
+    ways = [1]  # zero dice: one way to get sum 0
+    for _ in range(dice):
+        nxt = [0] * (len(ways) + faces - 1)
+        for s, w in enumerate(ways):
+            for f in range(faces):
+                nxt[s + f] += w
+        ways = nxt
+
+    total = faces ** dice
+    return {dice + k: w / total for k, w in enumerate(ways)}
+
+
+def wilson_half_widths(counts: np.ndarray, trials: int, z: float) -> np.ndarray:
+    # Half-width of the Wilson score interval for every proportion counts / trials
+    p = counts / trials
+    z2 = z * z
+    return z / (1 + z2 / trials) * np.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials))
+
+
+@profiling.hook("dice.simulate_until_precision")
+def simulate_until_precision(
+    max_abs_error: float,
+    confidence: float = 0.99,
+    dice: int = 2,
+    faces: int = 6,
+    seed: int | None = None,
+    batch_size: int = 1_000_000,
+    max_trials: int | None = None,
+    log=None,
+) -> tuple[dict[int, float], int]:
+    """
+    Roll dice in batches until the confidence interval of every sum probability
+    has half-width <= max_abs_error (Wilson score interval at "confidence").
+    After each batch log(record) is called with a dict:
+      trials, max_abs_error (vs analytical), max_ci_width (widest full interval), done.
+    Stops early at max_trials. Returns (probabilities, trials used).
+    """
+    if max_abs_error <= 0:
+        raise ValueError("max_abs_error must be positive.")
+    if max_trials is not None and max_trials < 1:
+        raise ValueError("max_trials must be at least 1.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1.")
+
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+
+    sums = range(dice, dice * faces + 1)
+    exact = analytical_probabilities(dice, faces)
+    exact_arr = np.array([exact[s] for s in sums])
+
+    counts = np.zeros(dice * faces + 1, dtype=np.int64)
+    trials = 0
+
+    while True:
+        m = batch_size if max_trials is None else min(batch_size, max_trials - trials)
+        if m <= 0:
+            break
+        counts += count_dice_sums(m, rng, dice=dice, faces=faces, chunk_size=batch_size)
+        trials += m
+
+        profiling.count("dice.adaptive_batches")
+
+        half = wilson_half_widths(counts[dice:], trials, z)
+        done = bool(half.max() <= max_abs_error)
+        limit_hit = max_trials is not None and trials >= max_trials
+
+        if log is not None:
+            log({
+                "trials": trials,
+                "max_abs_error": float(np.abs(counts[dice:] / trials - exact_arr).max()),
+                "max_ci_width": float(2 * half.max()),
+                "done": done,
+            })
+
+        if done or limit_hit:
+            break
+
+    return {s: counts[s] / trials for s in sums}, trials
+
+
+def convergence_logger(fmt: str, stream):
+    # Log callback for simulate_until_precision writing CSV or JSON lines, flushed per batch
+    fields = ["trials", "max_abs_error", "max_ci_width", "done"]
+    header_written = False
+
+    def log(record: dict) -> None:
+        nonlocal header_written
+        if fmt == "json":
+            stream.write(json.dumps(record) + "\n")
+        else:
+            if not header_written:
+                stream.write(",".join(fields) + "\n")
+                header_written = True
+            stream.write(",".join(str(record[f]) for f in fields) + "\n")
+        stream.flush()
+
+    return log
 
 
 def print_comparison(mc: dict[int, float], an: dict[int, float]) -> None:
     # Print a comparison table: Monte Carlo vs Analytical
     print(f"{'Sum':>3} | {'Monte Carlo':>11} | {'Analytical':>10} | {'Abs error':>9}")
     print("-" * 44)
-    for s in range(2, 13):
+    for s in sorted(mc):
         mc_p = mc[s]
         an_p = an[s]
         err = abs(mc_p - an_p)
@@ -43,7 +275,9 @@ def print_comparison(mc: dict[int, float], an: dict[int, float]) -> None:
 
 def plot_results(mc: dict[int, float], an: dict[int, float]) -> None:
     # Plot Monte Carlo and Analytical probabilities on the same chart
-    sums = list(range(2, 13))
+    import matplotlib.pyplot as plt  # lazy: only plotting needs matplotlib
+
+    sums = sorted(mc)
     mc_vals = [mc[s] for s in sums]
     an_vals = [an[s] for s in sums]
 
@@ -54,25 +288,120 @@ def plot_results(mc: dict[int, float], an: dict[int, float]) -> None:
     plt.bar([i - width / 2 for i in x], mc_vals, width=width, label="Monte Carlo")
     plt.bar([i + width / 2 for i in x], an_vals, width=width, label="Analytical")
     plt.xticks(list(x), sums)
-    plt.xlabel("Sum (two dice)")
+    plt.xlabel("Sum of dice")
     plt.ylabel("Probability")
-    plt.title("Two dice sum probabilities: Monte Carlo vs Analytical")
+    plt.title("Dice sum probabilities: Monte Carlo vs Analytical")
     plt.legend()
     plt.tight_layout()
     plt.show()
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Monte Carlo simulation for sums of two dice.")
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation for sums of dice.")
     parser.add_argument("--trials", type=int, default=100_000, help="Number of simulated rolls")
     parser.add_argument("--seed", type=int, default=None, help="Random seed (optional)")
     parser.add_argument("--plot", action="store_true", help="Show a matplotlib plot")
+    parser.add_argument(
+        "--engine",
+        choices=["python", "numpy"],
+        default="python",
+        help="python: random.randint loop (two six-sided dice); numpy: chunked vectorised rolls",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="Rolls per chunk (numpy engine)")
+    parser.add_argument("--dice", type=int, default=2, help="Number of dice (numpy engine)")
+    parser.add_argument("--faces", type=int, default=6, help="Faces per die (numpy engine)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (numpy engine)")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure numpy engine scaling for 1, 2, 4, ... workers up to --workers",
+    )
+    parser.add_argument(
+        "--max-abs-error",
+        type=float,
+        default=None,
+        help="Target precision: roll in batches of --chunk-size until every CI half-width is below this",
+    )
+    parser.add_argument("--confidence", type=float, default=0.99, help="Confidence level for --max-abs-error")
+    parser.add_argument(
+        "--max-trials",
+        type=int,
+        default=None,
+        help="Stop --max-abs-error mode after this many trials even if not converged",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["csv", "json"],
+        default="csv",
+        help="Convergence log format for --max-abs-error",
+    )
+    parser.add_argument("--log-file", default=None, help="Write the convergence log here instead of stderr")
     args = parser.parse_args()
 
-    mc = simulate_two_dice(trials=args.trials, seed=args.seed)
-    an = analytical_probabilities()
+    if args.dice < 1 or args.faces < 1 or args.chunk_size < 1 or args.workers < 1:
+        parser.error("--dice, --faces, --chunk-size and --workers must be positive")
+
+    if args.benchmark:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= args.workers:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != args.workers:
+            worker_counts.append(args.workers)
+
+        print(f"Trials: {args.trials}, CPUs: {os.cpu_count()}\n")
+        print_benchmark(benchmark_workers(
+            args.trials, worker_counts, dice=args.dice, faces=args.faces, chunk_size=args.chunk_size
+        ))
+        return
+
+    if args.max_abs_error is not None:
+        if args.workers != 1:
+            parser.error("--max-abs-error runs in a single process")
+        if not 0 < args.confidence < 1:
+            parser.error("--confidence must be between 0 and 1")
+        if args.max_abs_error <= 0:
+            parser.error("--max-abs-error must be positive")
+        if args.max_trials is not None and args.max_trials < 1:
+            parser.error("--max-trials must be at least 1")
+
+        stream = open(args.log_file, "w") if args.log_file else sys.stderr
+        try:
+            mc, trials = simulate_until_precision(
+                args.max_abs_error,
+                confidence=args.confidence,
+                dice=args.dice,
+                faces=args.faces,
+                seed=args.seed,
+                batch_size=args.chunk_size,
+                max_trials=args.max_trials,
+                log=convergence_logger(args.log_format, stream),
+            )
+        finally:
+            if args.log_file:
+                stream.close()
+        engine = "numpy (adaptive)"
+    elif args.engine == "numpy":
+        trials, engine = args.trials, args.engine
+        mc = simulate_dice_numpy(
+            trials=args.trials,
+            dice=args.dice,
+            faces=args.faces,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+    else:
+        if (args.dice, args.faces) != (2, 6) or args.workers != 1:
+            parser.error("--dice/--faces/--workers require --engine numpy")
+        trials, engine = args.trials, args.engine
+        mc = simulate_two_dice(trials=args.trials, seed=args.seed)
+
+    an = analytical_probabilities(args.dice, args.faces)
 
-    print(f"Trials: {args.trials}")
+    print(f"Engine: {engine}")
+    if args.workers > 1:
+        print(f"Workers: {args.workers}")
+    print(f"Trials: {trials}")
     if args.seed is not None:
         print(f"Seed: {args.seed}")
     print()